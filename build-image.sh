@@ -403,7 +403,17 @@ wait_for_web() {
 wait_for_start_button() {
   echo ""
   echo "Step 4: Waiting for DSM start button to appear..."
-  docker exec "$CONTAINER_NAME" \
+
+  # Pass through video recording opt-in (see BUILD.md "Video Recording").
+  # Note: wait-for-boot usually confirms over plain HTTP without launching
+  # a browser, so a video is only produced when it falls back to Playwright.
+  local video_args=()
+  if [[ -n "${DSM_RECORD_VIDEO:-}" ]]; then
+    video_args=(-e DSM_RECORD_VIDEO="$DSM_RECORD_VIDEO")
+  fi
+
+  docker exec "${video_args[@]}" \
+    "$CONTAINER_NAME" \
     /opt/venv/bin/python /tmp/provision-dsm.py wait-for-boot --vm-ip "${DSM_VM_IP}"
   echo "✓ Start button appeared"
 }
@@ -419,7 +429,13 @@ run_playwright_step() {
   # Create videos directory if it doesn't exist
   mkdir -p "$PWD/videos"
 
-  docker exec "$@" \
+  # Pass through video recording opt-in (see BUILD.md "Video Recording")
+  local video_args=()
+  if [[ -n "${DSM_RECORD_VIDEO:-}" ]]; then
+    video_args=(-e DSM_RECORD_VIDEO="$DSM_RECORD_VIDEO")
+  fi
+
+  docker exec "${video_args[@]}" "$@" \
     "$CONTAINER_NAME" \
     /opt/venv/bin/python /tmp/provision-dsm.py "${command}" --vm-ip "${DSM_VM_IP}"
 
@@ -6,14 +6,22 @@ This script runs inside the Docker container and automates DSM setup via Playwri
 
 import asyncio
 import argparse
+import http.client
 import ipaddress
+import json
 import os
+import random
+import re
+import shutil
+import socket
 import sys
 import time
+import urllib.parse
 import urllib.request
 import urllib.error
 
 from playwright.async_api import (
+    BrowserContext,
     Page,
     TimeoutError as PlaywrightTimeoutError,
     async_playwright,
@@ -22,27 +30,113 @@ from playwright.async_api import (
 # Video recording directory (mounted from host's ./videos directory)
 VIDEO_DIR = "/tmp/playwright-videos"
 
+# Browser state shared between sub-commands (cookies, localStorage, etc.)
+STORAGE_STATE_FILE = "/tmp/dsm-storage-state.json"
+
+# UNIX socket the daemon listens on; when present, sub-commands are
+# forwarded to the running daemon instead of launching a fresh browser
+SOCKET_PATH = "/tmp/dsm-provision.sock"
+
+# Environment overrides the command handlers read at run time; forwarded
+# with each daemon request so values passed to the client process (e.g.
+# docker exec -e DSM_ADMIN_PASS=...) behave the same as in one-shot mode
+FORWARDED_ENV_VARS = (
+    "DSM_SERVER_NAME",
+    "DSM_ADMIN_USER",
+    "DSM_ADMIN_PASS",
+    "PLAYWRIGHT_SCREENSHOT",
+)
+
 
 def wait_for_http(url: str, timeout: int = 600) -> None:
-    """Wait for HTTP port to respond."""
+    """Wait for HTTP port to respond.
+
+    Probes with HEAD requests over a single keep-alive connection and
+    exponential backoff, so repeated attempts don't each pay a TCP
+    handshake; the connection is rebuilt only after an error (DSM often
+    opens the port before it starts answering cleanly).
+    """
     print(f"[dsm] Waiting for {url} to respond...", flush=True)
+    parts = urllib.parse.urlsplit(url)
+    host = parts.hostname
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    path = parts.path or "/"
+
     start = time.time()
     last_print = 0
-    while time.time() - start < timeout:
-        try:
-            urllib.request.urlopen(url, timeout=1)
-            print(f"[dsm] ✓ {url} is responding", flush=True)
-            return
-        except (urllib.error.URLError, OSError):
+    attempt = 0
+    conn = http.client.HTTPConnection(host, port, timeout=2)
+    try:
+        while time.time() - start < timeout:
+            try:
+                conn.request("HEAD", path)
+                response = conn.getresponse()
+                response.read()
+                if response.status < 500:
+                    print(f"[dsm] ✓ {url} is responding", flush=True)
+                    return
+            except (http.client.HTTPException, OSError):
+                # Refused, dropped, or garbled - start a fresh connection
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=2)
+
             elapsed = int(time.time() - start)
             if elapsed - last_print >= 10:
                 print(f"[dsm] Still waiting... ({elapsed}s/{timeout}s)", flush=True)
                 last_print = elapsed
-            time.sleep(1)
+
+            # Exponential backoff with jitter, capped at 5s
+            delay = min(5.0, 0.25 * 2**attempt)
+            time.sleep(delay + random.uniform(0, delay / 4))
+            attempt += 1
+    finally:
+        conn.close()
 
     raise TimeoutError(f"Timeout waiting for {url} to respond after {timeout}s")
 
 
+# Class on DSM's welcome-screen start button, matched in raw page HTML
+START_BUTTON_RE = re.compile(rb"welcome-page-btn")
+
+
+def wait_for_boot_http(base_url: str, timeout: int = 600) -> bool:
+    """Check for the DSM start button with plain HTTP, no browser needed.
+
+    Returns True once the start button markup shows up in the served page,
+    letting the caller skip the Chromium launch entirely. Returns False if
+    the page keeps serving without the marker (a build that renders the
+    button client-side), in which case the Playwright check is still needed.
+    """
+    print(f"[dsm] wait-for-boot: Checking {base_url} for start button", flush=True)
+    start = time.time()
+    misses = 0
+    while time.time() - start < timeout:
+        try:
+            with urllib.request.urlopen(base_url, timeout=5) as response:
+                body = response.read()
+        except (urllib.error.URLError, OSError):
+            time.sleep(1)
+            continue
+
+        if START_BUTTON_RE.search(body):
+            print(
+                "[dsm] wait-for-boot: ✓ Start button detected - DSM is ready!",
+                flush=True,
+            )
+            return True
+
+        misses += 1
+        if misses >= 5:
+            print(
+                "[dsm] wait-for-boot: Start button not in served HTML, falling back to browser check",
+                flush=True,
+            )
+            return False
+        time.sleep(2)
+
+    raise TimeoutError(f"Timeout waiting for DSM start button after {timeout}s")
+
+
 async def wait_for_boot(page: Page, base_url: str) -> None:
     """Wait for DSM to boot and show the start button."""
     print(f"[dsm] wait-for-boot: Connecting with Playwright to {base_url}", flush=True)
@@ -50,16 +144,14 @@ async def wait_for_boot(page: Page, base_url: str) -> None:
     await page.goto(base_url, wait_until="domcontentloaded", timeout=180_000)
     print(f"[dsm] wait-for-boot: Navigated to {base_url}", flush=True)
 
-    await page.wait_for_load_state("networkidle", timeout=180_000)
     print(f"[dsm] wait-for-boot: Current URL: {page.url}", flush=True)
 
     # Wait for start button to appear
-    start_selector = "button.welcome-page-btn"
     print("[dsm] wait-for-boot: Waiting for start button...", flush=True)
 
-    await page.wait_for_function(
-        "selector => document.querySelector(selector) !== null",
-        arg=start_selector,
+    await page.wait_for_selector(
+        "button.welcome-page-btn",
+        state="attached",
         timeout=600_000,  # 10 minutes for initial boot
     )
 
@@ -69,10 +161,7 @@ async def wait_for_boot(page: Page, base_url: str) -> None:
 async def click_start_button(page: Page) -> None:
     """Click the initial start button."""
     print("[dsm] configure-admin: Clicking start button", flush=True)
-    await page.wait_for_selector(
-        "button.welcome-page-btn", state="visible", timeout=120_000
-    )
-    await page.click("button.welcome-page-btn")
+    await page.click("button.welcome-page-btn", timeout=120_000)
     print("[dsm] configure-admin: ✓ Start button clicked", flush=True)
 
 
@@ -90,13 +179,16 @@ async def fill_admin_form(
 
     await page.wait_for_selector("#syno-0", state="visible", timeout=120_000)
 
-    await page.fill("#syno-0", server_name)
-    await page.fill("#syno-1", admin_user)
-    await page.fill("#syno-2", admin_pass)
-    await page.fill("#syno-3", admin_pass)
+    # The form is mounted - let the driver pipeline all four fills instead
+    # of paying a round-trip per field
+    await asyncio.gather(
+        page.fill("#syno-0", server_name),
+        page.fill("#syno-1", admin_user),
+        page.fill("#syno-2", admin_pass),
+        page.fill("#syno-3", admin_pass),
+    )
 
-    await page.wait_for_selector("button.v-btn-main", state="visible", timeout=10_000)
-    await page.click("button.v-btn-main")
+    await page.click("button.v-btn-main", timeout=10_000)
     print("[dsm] configure-admin: ✓ Administrator form submitted", flush=True)
 
     # Wait for the admin form to disappear (DSM has processed and saved the config)
@@ -116,7 +208,6 @@ async def configure_admin(page: Page, base_url: str) -> None:
     print(f"[dsm] configure-admin: Admin user: {admin_user}", flush=True)
 
     await page.goto(base_url, wait_until="domcontentloaded", timeout=180_000)
-    await page.wait_for_load_state("networkidle", timeout=180_000)
 
     await click_start_button(page)
     await fill_admin_form(
@@ -126,79 +217,102 @@ async def configure_admin(page: Page, base_url: str) -> None:
     print("[dsm] configure-admin: ✓ Admin configuration complete", flush=True)
 
 
+async def configure_updates_screen(page: Page):
+    """Click the 'notify me' radio button for manual updates."""
+    radio = page.locator(
+        "div.v-radio-wrapper[syno-id='welcome-app-select-update-radio-notify']"
+    )
+    await radio.click()
+
+
+async def close_notification_setup(page: Page):
+    """Close the notification setup panel by clicking the close button."""
+    # Find the notification panel with the "Notification Setup" title
+    panel = page.locator(
+        "div.v-notification-panel:has(div.v-notification-title:text('Notification Setup'))"
+    )
+    await panel.wait_for(state="visible", timeout=10_000)
+
+    # Click the close button within this specific panel
+    close_btn = panel.locator("i.close-btn.window-tool-close")
+    await close_btn.click()
+
+
+# Wizard screens with their identifying CSS/text and actions. Text patterns
+# are compiled once here; recompiling them per locator creation in the
+# polling loop is pure overhead.
+WIZARD_SCREENS = [
+    {
+        "name": "Update Options",
+        "css": "div.welcome-step-title",
+        "text": re.compile(r"Select an update option"),
+        "action": configure_updates_screen,  # Custom action before clicking button
+        "button": "button.v-btn-main",  # Next button
+    },
+    {
+        "name": "Synology Account",
+        "css": "div.welcome-step-title",
+        "text": re.compile(r"Create a Synology Account"),
+        "button": "button[syno-id='welcome-app-wizard-fbar-back']",  # Skip button
+    },
+    {
+        "name": "User Experience",
+        "css": "div.welcome-step-title",
+        "text": re.compile(r"Opt-in for a better user experience"),
+        "button": "button[syno-id='welcome-app-wizard-fbar-next']",  # Submit button
+    },
+    {
+        "name": "File Access Promotion",
+        "css": "div.title",
+        "text": re.compile(r"Securely Access and Share Files From Anywhere"),
+        "button": "button[syno-id='syno-promotion-preinstall-btn-skip']",  # No, thanks button
+    },
+    {
+        "name": "2FA Promotion",
+        "css": "div.title",
+        "text": re.compile(r"Enable 2-Factor Authentication \(2FA\)"),
+        "button": "button[syno-id='syno-promotion-ss-btn-skip']",  # No, thanks button
+    },
+    {
+        "name": "Adaptive MFA Promotion",
+        "css": "div.title",
+        "text": re.compile(r"Protect your account with Adaptive MFA"),
+        "button": "button[syno-id='syno-promotion-manually-amfa-btn-give-up']",  # I don't want to secure my account
+    },
+    {
+        "name": "MFA Warning Confirmation",
+        "css": "div.dialog-content",
+        "text": re.compile(r"We strongly recommend enabling 2FA or Adaptive MFA"),
+        "button": "button[syno-id='promotion-app-window-msgbox-fbar-commit']",  # OK button
+    },
+    {
+        "name": "Notification Setup",
+        "css": "div.v-notification-title",
+        "text": re.compile(r"Notification Setup"),
+        "action": close_notification_setup,  # Custom action to click close button
+    },
+    {
+        "name": "Notification Setup Reminder",
+        "css": "div.dialog-content",
+        "text": re.compile(r"You can enable notifications later"),
+        "button": "button[syno-id='window-manager-msg-box-fbar-commit']",  # OK button
+    },
+]
+
+
 async def handle_post_wizard(page: Page, base_url: str) -> None:
     """Handle post-wizard dialogs and prompts using state machine approach."""
-
-    async def configure_updates_screen(page: Page):
-        """Click the 'notify me' radio button for manual updates."""
-        radio = page.locator(
-            "div.v-radio-wrapper[syno-id='welcome-app-select-update-radio-notify']"
-        )
-        await radio.click()
-        await asyncio.sleep(0.5)  # Brief pause for UI to update
-
-    async def close_notification_setup(page: Page):
-        """Close the notification setup panel by clicking the close button."""
-        # Find the notification panel with the "Notification Setup" title
-        panel = page.locator(
-            "div.v-notification-panel:has(div.v-notification-title:text('Notification Setup'))"
-        )
-        await panel.wait_for(state="visible", timeout=10_000)
-
-        # Click the close button within this specific panel
-        close_btn = panel.locator("i.close-btn.window-tool-close")
-        await close_btn.click()
-        await asyncio.sleep(0.5)  # Brief pause for UI to update
-
-    # Define wizard screens with their identifiers and actions
-    wizard_screens = [
-        {
-            "name": "Update Options",
-            "identifier": "div.welcome-step-title >> text=/Select an update option/",
-            "action": configure_updates_screen,  # Custom action before clicking button
-            "button": "button.v-btn-main",  # Next button
-        },
-        {
-            "name": "Synology Account",
-            "identifier": "div.welcome-step-title >> text=/Create a Synology Account/",
-            "button": "button[syno-id='welcome-app-wizard-fbar-back']",  # Skip button
-        },
-        {
-            "name": "User Experience",
-            "identifier": "div.welcome-step-title >> text=/Opt-in for a better user experience/",
-            "button": "button[syno-id='welcome-app-wizard-fbar-next']",  # Submit button
-        },
-        {
-            "name": "File Access Promotion",
-            "identifier": "div.title >> text=/Securely Access and Share Files From Anywhere/",
-            "button": "button[syno-id='syno-promotion-preinstall-btn-skip']",  # No, thanks button
-        },
-        {
-            "name": "2FA Promotion",
-            "identifier": "div.title >> text=/Enable 2-Factor Authentication \\(2FA\\)/",
-            "button": "button[syno-id='syno-promotion-ss-btn-skip']",  # No, thanks button
-        },
-        {
-            "name": "Adaptive MFA Promotion",
-            "identifier": "div.title >> text=/Protect your account with Adaptive MFA/",
-            "button": "button[syno-id='syno-promotion-manually-amfa-btn-give-up']",  # I don't want to secure my account
-        },
-        {
-            "name": "MFA Warning Confirmation",
-            "identifier": "div.dialog-content >> text=/We strongly recommend enabling 2FA or Adaptive MFA/",
-            "button": "button[syno-id='promotion-app-window-msgbox-fbar-commit']",  # OK button
-        },
-        {
-            "name": "Notification Setup",
-            "identifier": "div.v-notification-title >> text=/Notification Setup/",
-            "action": close_notification_setup,  # Custom action to click close button
-        },
-        {
-            "name": "Notification Setup Reminder",
-            "identifier": "div.dialog-content >> text=/You can enable notifications later/",
-            "button": "button[syno-id='window-manager-msg-box-fbar-commit']",  # OK button
-        },
-    ]
+    # Work on per-run copies so the cached locators don't leak between runs
+    wizard_screens = [dict(screen) for screen in WIZARD_SCREENS]
+
+    # Build each screen's locators once - creating them per iteration adds
+    # up to thousands of throwaway locator objects over the polling loop
+    for screen in wizard_screens:
+        # has_text with a compiled pattern skips the text-engine selector
+        # parser that "css >> text=/.../" strings would hit on every use
+        screen["_id_loc"] = page.locator(screen["css"], has_text=screen["text"])
+        if "button" in screen:
+            screen["_btn_loc"] = page.locator(screen["button"])
 
     print(f"[dsm] post-wizard: Connecting to {base_url}", flush=True)
 
@@ -207,7 +321,6 @@ async def handle_post_wizard(page: Page, base_url: str) -> None:
     for retry in range(max_retries):
         try:
             await page.goto(base_url, wait_until="domcontentloaded", timeout=180_000)
-            await page.wait_for_load_state("networkidle", timeout=180_000)
             break
         except Exception as e:
             if retry < max_retries - 1:
@@ -229,8 +342,9 @@ async def handle_post_wizard(page: Page, base_url: str) -> None:
     all_screen_names = {screen["name"] for screen in wizard_screens}
     screens_seen = set()
     timeout_seconds = 300  # 5 minutes
+    no_match_seconds = 30  # Finish once no screen has appeared for this long
     start_time = time.time()
-    consecutive_no_match = 0
+    last_match_time = start_time
 
     while True:
         elapsed = time.time() - start_time
@@ -260,79 +374,96 @@ async def handle_post_wizard(page: Page, base_url: str) -> None:
             )
             break
 
-        await asyncio.sleep(1)  # Brief pause between checks
-
-        # Check each known screen
-        screen_found = False
-        for screen in wizard_screens:
-            try:
-                # Check if this screen's identifier is visible
-                identifier = page.locator(screen["identifier"])
-                if await identifier.is_visible():
-                    screen_found = True
-                    screen_name = screen["name"]
-
-                    # Skip if we've already processed this screen
-                    if screen_name in screens_seen:
-                        continue
-
-                    screens_seen.add(screen_name)
-                    print(
-                        f"[dsm] post-wizard: Detected screen: {screen_name} ({len(screens_seen)}/{len(all_screen_names)})",
-                        flush=True,
-                    )
-
-                    # Execute custom action if defined
-                    if "action" in screen:
-                        await screen["action"](page)
-                        print(
-                            f"[dsm] post-wizard: Executed action for {screen_name}",
-                            flush=True,
-                        )
-
-                    # Click the button for this screen (if defined)
-                    if "button" in screen:
-                        button = page.locator(screen["button"])
-                        # Use first() to handle cases where multiple matching elements exist
-                        await button.first.wait_for(state="visible", timeout=10_000)
-                        await button.first.click()
-                        print(
-                            f"[dsm] post-wizard: Clicked button for {screen_name}",
-                            flush=True,
-                        )
-
-                    # Wait for the identifier to disappear (screen changed)
-                    await identifier.wait_for(state="hidden", timeout=30_000)
-                    print(
-                        f"[dsm] post-wizard: Screen changed from {screen_name}",
-                        flush=True,
-                    )
+        # Race visibility waits for every unhandled screen; whichever
+        # appears first wins and the rest are cancelled. wait_for is
+        # event-driven on the selector-engine side, so the idle cost is
+        # nil and a new screen is dispatched at its appearance latency
+        # instead of on the next polling tick.
+        pending = [s for s in wizard_screens if s["name"] not in screens_seen]
+        tasks = {
+            asyncio.create_task(
+                screen["_id_loc"].wait_for(state="visible", timeout=2_000)
+            ): screen
+            for screen in pending
+        }
+        done, not_done = await asyncio.wait(
+            tasks, timeout=5, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in not_done:
+            task.cancel()
+        await asyncio.gather(*not_done, return_exceptions=True)
+
+        # Tasks that finished by timing out are misses; any other failure
+        # (closed page, crashed context) is fatal, not a miss
+        screen = None
+        for task in done:
+            exc = task.exception()
+            if exc is None:
+                if screen is None:
+                    screen = tasks[task]
+            elif not isinstance(exc, PlaywrightTimeoutError):
+                print(
+                    f"[dsm] post-wizard: FATAL ERROR probing screen {tasks[task]['name']}: {exc.__class__.__name__}: {exc}",
+                    flush=True,
+                )
+                raise exc
 
-                    # Wait for navigation to settle
-                    await page.wait_for_load_state("networkidle", timeout=30_000)
-                    break
+        if screen is None:
+            # If we haven't found any screens for a while, we're probably done
+            if time.time() - last_match_time >= no_match_seconds:
+                print(
+                    f"[dsm] post-wizard: No screens detected for {no_match_seconds} seconds, finishing",
+                    flush=True,
+                )
+                break
+            # Pace the next round - waits that end early would otherwise
+            # re-probe in a tight loop
+            await asyncio.sleep(0.5)
+            continue
+
+        last_match_time = time.time()
+        screen_name = screen["name"]
+        identifier = screen["_id_loc"]
+        try:
+            screens_seen.add(screen_name)
+            print(
+                f"[dsm] post-wizard: Detected screen: {screen_name} ({len(screens_seen)}/{len(all_screen_names)})",
+                flush=True,
+            )
 
-            except PlaywrightTimeoutError:
-                # This screen's identifier not found or action timed out
-                continue
-            except Exception as e:
+            # Execute custom action if defined
+            if "action" in screen:
+                await screen["action"](page)
                 print(
-                    f"[dsm] post-wizard: FATAL ERROR handling screen {screen['name']}: {e.__class__.__name__}: {e}",
+                    f"[dsm] post-wizard: Executed action for {screen_name}",
                     flush=True,
                 )
-                raise
 
-        if not screen_found:
-            consecutive_no_match += 1
-            # If we haven't found any screens for 30 seconds (30 iterations), we're probably done
-            if consecutive_no_match >= 30:
+            # Click the button for this screen (if defined)
+            if "button" in screen:
+                button = screen["_btn_loc"]
+                # Use first() to handle cases where multiple matching elements exist
+                await button.first.click(timeout=10_000)
                 print(
-                    "[dsm] post-wizard: No screens detected for 30 seconds, finishing",
+                    f"[dsm] post-wizard: Clicked button for {screen_name}",
                     flush=True,
                 )
-                break
-        else:
-            consecutive_no_match = 0
+
+            # Wait for the identifier to disappear (screen changed)
+            await identifier.wait_for(state="hidden", timeout=30_000)
+            print(
+                f"[dsm] post-wizard: Screen changed from {screen_name}",
+                flush=True,
+            )
+        except PlaywrightTimeoutError:
+            # The screen's button or transition timed out; re-probe
+            continue
+        except Exception as e:
+            print(
+                f"[dsm] post-wizard: FATAL ERROR handling screen {screen['name']}: {e.__class__.__name__}: {e}",
+                flush=True,
+            )
+            raise
 
     # Report which screens we saw and which we didn't
     all_screen_names = {screen["name"] for screen in wizard_screens}
@@ -359,7 +490,6 @@ async def handle_post_wizard(page: Page, base_url: str) -> None:
         )
 
     print("[dsm] post-wizard: ✓ Post-wizard handling complete", flush=True)
-    await asyncio.sleep(2)  # Brief pause before next steps
 
 
 async def configure_system(page: Page, base_url: str) -> None:
@@ -369,7 +499,6 @@ async def configure_system(page: Page, base_url: str) -> None:
     print(f"[dsm] configure-system: Connecting to {base_url}", flush=True)
 
     await page.goto(base_url, wait_until="domcontentloaded", timeout=60_000)
-    await page.wait_for_load_state("networkidle", timeout=60_000)
 
     print("[dsm] configure-system: Waiting for DSM desktop...", flush=True)
     await page.wait_for_selector(
@@ -379,55 +508,75 @@ async def configure_system(page: Page, base_url: str) -> None:
     )
     print("[dsm] configure-system: ✓ DSM desktop detected", flush=True)
 
-    # Open Control Panel
-    print("[dsm] configure-system: Opening Control Panel...", flush=True)
-    control_panel = page.locator(
-        "li[syno-id='SYNO.SDS.AdminCenter.Application'].icon-item"
+    # Open Control Panel directly on File Services' NFS tab via DSM's own
+    # launcher API - one evaluate() instead of simulating three clicks. A
+    # throwing launch (partially initialized desktop, different signature
+    # on another build) counts as unavailable rather than failing the run.
+    print("[dsm] configure-system: Opening Control Panel at NFS...", flush=True)
+    launched = await page.evaluate(
+        """() => {
+            const launcher = window.SYNO?.SDS?.AppLaunch?.instance;
+            if (!launcher) {
+                return false;
+            }
+            try {
+                launcher.launch('SYNO.SDS.AdminCenter.Application', {
+                    tab: 'file_service',
+                    subtab: 'nfs',
+                });
+                return true;
+            } catch (e) {
+                return false;
+            }
+        }"""
     )
-    await control_panel.wait_for(state="visible", timeout=30_000)
-    await control_panel.click()
-    print("[dsm] configure-system: Control Panel clicked", flush=True)
 
-    # Wait for Control Panel to open
-    await asyncio.sleep(2)
-
-    # Open File Services
-    print("[dsm] configure-system: Opening File Services...", flush=True)
-    file_services = page.locator("div[fn='SYNO.SDS.AdminCenter.FileService.Main']")
-    await file_services.wait_for(state="visible", timeout=30_000)
-    await file_services.click()
-    print("[dsm] configure-system: File Services opened", flush=True)
+    if launched:
+        # launch() not throwing doesn't prove the pane opened - give the
+        # NFS form a short window to appear before trusting it
+        try:
+            await page.wait_for_selector(
+                "input[name='enable_nfs']", state="attached", timeout=10_000
+            )
+            print(
+                "[dsm] configure-system: Control Panel launched at NFS tab", flush=True
+            )
+        except PlaywrightTimeoutError:
+            launched = False
+            print(
+                "[dsm] configure-system: NFS pane did not appear after launch",
+                flush=True,
+            )
 
-    # Wait for File Services to load
-    await asyncio.sleep(2)
+    if not launched:
+        # Launcher not usable on this build - click through the UI
+        print("[dsm] configure-system: Clicking through UI to NFS...", flush=True)
+        control_panel = page.locator(
+            "li[syno-id='SYNO.SDS.AdminCenter.Application'].icon-item"
+        )
+        await control_panel.click(timeout=30_000)
+        print("[dsm] configure-system: Control Panel clicked", flush=True)
 
-    # Switch to NFS tab
-    print("[dsm] configure-system: Switching to NFS tab...", flush=True)
-    nfs_tab = page.locator("span.x-tab-strip-text >> text=/^NFS$/")
-    await nfs_tab.wait_for(state="visible", timeout=30_000)
-    await nfs_tab.click()
-    print("[dsm] configure-system: NFS tab clicked", flush=True)
+        file_services = page.locator("div[fn='SYNO.SDS.AdminCenter.FileService.Main']")
+        await file_services.click(timeout=30_000)
+        print("[dsm] configure-system: File Services opened", flush=True)
 
-    # Wait for tab to switch
-    await asyncio.sleep(1)
+        nfs_tab = page.locator("span.x-tab-strip-text >> text=/^NFS$/")
+        await nfs_tab.click(timeout=30_000)
+        print("[dsm] configure-system: NFS tab clicked", flush=True)
 
     # Enable NFS service
     print("[dsm] configure-system: Enabling NFS service...", flush=True)
 
     # Click the styled checkbox icon div (the visual element that users actually click)
     nfs_icon = page.locator("input[name='enable_nfs'] + div.syno-ux-checkbox-icon")
-    await nfs_icon.wait_for(state="visible", timeout=30_000)
-    await nfs_icon.click()
+    await nfs_icon.click(timeout=30_000)
     print("[dsm] configure-system: NFS service checkbox icon clicked", flush=True)
 
-    # Wait a moment for the UI to update
-    await asyncio.sleep(1)
-
     # Click Apply button
     print("[dsm] configure-system: Clicking Apply...", flush=True)
     apply_button = page.locator("button.x-btn-text >> text=/^Apply$/")
-    await apply_button.wait_for(state="visible", timeout=30_000)
-    await apply_button.click()
+    await apply_button.click(timeout=30_000)
     print("[dsm] configure-system: Apply clicked", flush=True)
 
     # Wait for "Changes applied" message
@@ -438,9 +587,6 @@ async def configure_system(page: Page, base_url: str) -> None:
     await success_message.wait_for(state="visible", timeout=30_000)
     print("[dsm] configure-system: Changes applied successfully", flush=True)
 
-    # Wait 5 more seconds
-    await asyncio.sleep(5)
-
     # Take screenshot
     if screenshot_path:
         os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
@@ -452,15 +598,220 @@ async def configure_system(page: Page, base_url: str) -> None:
     print("[dsm] configure-system: ✓ System configuration complete", flush=True)
 
 
+def build_context_options() -> dict:
+    """Build browser context options shared by one-shot and daemon modes."""
+    context_options = {}
+
+    # Load saved storage state if it exists
+    if os.path.exists(STORAGE_STATE_FILE):
+        print(
+            f"[dsm] Loading saved browser state from {STORAGE_STATE_FILE}",
+            flush=True,
+        )
+        context_options["storage_state"] = STORAGE_STATE_FILE
+
+    # Video recording is expensive (continuous webm encoding) - only enable
+    # it when explicitly requested for diagnostics
+    if os.getenv("DSM_RECORD_VIDEO"):
+        context_options["record_video_dir"] = VIDEO_DIR
+        context_options["record_video_size"] = {"width": 1280, "height": 720}
+
+    return context_options
+
+
+async def run_command(
+    command: str,
+    page: Page,
+    context: BrowserContext,
+    base_url: str,
+    env: dict | None = None,
+) -> None:
+    """Dispatch one automation command against an existing page/context.
+
+    `env` carries DSM_* overrides forwarded from a client invocation; they
+    are applied for the duration of the command so the handlers see the
+    client's environment, not the daemon's.
+    """
+    saved_env = {}
+    if env:
+        for key in FORWARDED_ENV_VARS:
+            if key in env:
+                saved_env[key] = os.environ.get(key)
+                os.environ[key] = env[key]
+
+    try:
+        if command == "wait-for-boot":
+            # The HTTP waits block on time.sleep/urlopen; run them in a thread
+            # so the daemon's accept loop (including shutdown) stays responsive
+            await asyncio.to_thread(wait_for_http, base_url, 600)
+            if await asyncio.to_thread(wait_for_boot_http, base_url, 600):
+                return
+            await wait_for_boot(page, base_url)
+        elif command == "configure-admin":
+            await configure_admin(page, base_url)
+            # Save browser state (cookies, localStorage, etc.) for crash recovery
+            await context.storage_state(path=STORAGE_STATE_FILE)
+            print(f"[dsm] Saved browser state to {STORAGE_STATE_FILE}", flush=True)
+        elif command == "post-wizard":
+            await handle_post_wizard(page, base_url)
+            # Update saved state after post-wizard
+            await context.storage_state(path=STORAGE_STATE_FILE)
+            print(f"[dsm] Updated browser state in {STORAGE_STATE_FILE}", flush=True)
+        elif command == "configure-system":
+            await configure_system(page, base_url)
+        else:
+            raise ValueError(f"Unknown command: {command}")
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def send_to_daemon(command: str) -> int | None:
+    """Forward a command to the running daemon and wait for its result.
+
+    Returns None when the socket file is stale (no daemon accepting on it),
+    after removing it, so the caller can fall back to running one-shot.
+    """
+    print(f"[dsm] Forwarding {command} to daemon at {SOCKET_PATH}", flush=True)
+    with socket.socket(socket.AF_UNIX) as sock:
+        try:
+            sock.connect(SOCKET_PATH)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Leftover socket from a daemon that died uncleanly
+            print(
+                f"[dsm] Daemon socket {SOCKET_PATH} is stale, removing it",
+                flush=True,
+            )
+            try:
+                os.unlink(SOCKET_PATH)
+            except FileNotFoundError:
+                pass
+            return None
+        request = {
+            "command": command,
+            "env": {k: os.environ[k] for k in FORWARDED_ENV_VARS if k in os.environ},
+        }
+        sock.sendall((json.dumps(request) + "\n").encode())
+        response = b""
+        while not response.endswith(b"\n"):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            response += chunk
+
+    # An empty or garbled reply means the daemon died mid-command
+    try:
+        reply = json.loads(response)
+    except ValueError:
+        print(
+            "[dsm] ERROR: daemon closed the connection without a valid reply",
+            file=sys.stderr,
+            flush=True,
+        )
+        return 1
+
+    if reply.get("ok"):
+        return 0
+    print(
+        f"[dsm] ERROR: daemon failed: {reply.get('error', 'unknown error')}",
+        file=sys.stderr,
+        flush=True,
+    )
+    return 1
+
+
+async def run_daemon(vm_ip: str) -> int:
+    """Serve automation commands over a UNIX socket with one shared browser.
+
+    Each one-shot invocation pays Chromium cold-start plus Playwright driver
+    spawn; the daemon starts them once and reuses the same context for every
+    command, so the storage-state file round-trip between steps disappears.
+    Send {"command": "shutdown"} to stop the daemon.
+    """
+    base_url = os.getenv("DSM_BASE_URL", f"http://{vm_ip}:5000")
+    print(f"[dsm] Starting daemon for {base_url}", flush=True)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=True,
+            args=[
+                "--disable-gpu",
+                "--disable-software-rasterizer",
+                "--use-gl=swiftshader",
+            ],
+        )
+        context = await browser.new_context(**build_context_options())
+        page = await context.new_page()
+        page.set_default_timeout(180_000)
+
+        shutdown = asyncio.Event()
+
+        async def handle_client(reader, writer):
+            try:
+                line = await reader.readline()
+                request = json.loads(line)
+                command = request.get("command", "")
+                if command == "shutdown":
+                    reply = {"ok": True}
+                    shutdown.set()
+                else:
+                    print(f"[dsm] daemon: Running {command}", flush=True)
+                    await run_command(
+                        command, page, context, base_url, env=request.get("env")
+                    )
+                    reply = {"ok": True}
+            except Exception as e:
+                reply = {"ok": False, "error": f"{e.__class__.__name__}: {e}"}
+            writer.write((json.dumps(reply) + "\n").encode())
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+        if os.path.exists(SOCKET_PATH):
+            os.unlink(SOCKET_PATH)
+        server = await asyncio.start_unix_server(handle_client, path=SOCKET_PATH)
+        print(f"[dsm] Daemon listening on {SOCKET_PATH}", flush=True)
+
+        try:
+            await shutdown.wait()
+        finally:
+            server.close()
+            await server.wait_closed()
+            if os.path.exists(SOCKET_PATH):
+                os.unlink(SOCKET_PATH)
+            await context.close()
+            await browser.close()
+
+    print("[dsm] Daemon stopped", flush=True)
+    return 0
+
+
 async def run(command: str, vm_ip: str) -> int:
     """Run the specified automation command."""
+    if command == "daemon":
+        return await run_daemon(vm_ip)
+
+    # A running daemon already owns a browser - reuse it instead of paying
+    # another Chromium cold-start. A stale socket (daemon died uncleanly)
+    # falls through to the one-shot path below.
+    if os.path.exists(SOCKET_PATH):
+        result = send_to_daemon(command)
+        if result is not None:
+            return result
+
     base_url = os.getenv("DSM_BASE_URL", f"http://{vm_ip}:5000")
-    storage_state_file = "/tmp/dsm-storage-state.json"
     print(f"[dsm] Running command: {command} against {base_url}", flush=True)
 
     # For wait-for-boot, check HTTP first before starting Playwright
     if command == "wait-for-boot":
         wait_for_http(base_url, timeout=600)
+        # Usually the start button is visible in the served HTML, in which
+        # case there's nothing a browser launch would add
+        if wait_for_boot_http(base_url, timeout=600):
+            return 0
 
     async with async_playwright() as p:
         browser = await p.chromium.launch(
@@ -471,21 +822,7 @@ async def run(command: str, vm_ip: str) -> int:
                 "--use-gl=swiftshader",
             ],
         )
-
-        # Load saved storage state if it exists
-        context_options = {}
-        if os.path.exists(storage_state_file):
-            print(
-                f"[dsm] Loading saved browser state from {storage_state_file}",
-                flush=True,
-            )
-            context_options["storage_state"] = storage_state_file
-
-        # Enable video recording for all commands
-        context_options["record_video_dir"] = VIDEO_DIR
-        context_options["record_video_size"] = {"width": 1280, "height": 720}
-
-        context = await browser.new_context(**context_options)
+        context = await browser.new_context(**build_context_options())
         page = await context.new_page()
 
         # Set timeout based on command
@@ -496,49 +833,32 @@ async def run(command: str, vm_ip: str) -> int:
 
         try:
             if command == "wait-for-boot":
+                # HTTP checks above already ran; go straight to the browser check
                 await wait_for_boot(page, base_url)
-            elif command == "configure-admin":
-                await configure_admin(page, base_url)
-                # Save browser state (cookies, localStorage, etc.) for subsequent steps
-                await context.storage_state(path=storage_state_file)
-                print(f"[dsm] Saved browser state to {storage_state_file}", flush=True)
-            elif command == "post-wizard":
-                await handle_post_wizard(page, base_url)
-                # Update saved state after post-wizard
-                await context.storage_state(path=storage_state_file)
-                print(
-                    f"[dsm] Updated browser state in {storage_state_file}", flush=True
-                )
-            elif command == "configure-system":
-                await configure_system(page, base_url)
             else:
-                print(
-                    f"[dsm] ERROR: Unknown command: {command}",
-                    file=sys.stderr,
-                    flush=True,
-                )
-                return 1
+                await run_command(command, page, context, base_url)
         finally:
-            # Save and rename video before closing (even if error occurred)
-            try:
-                # Get video path before closing page to avoid race condition
-                video_path = await page.video.path()
-                await page.close()
-
-                # Rename video to include command name
-                import shutil
-
-                video_dir = os.path.dirname(video_path)
-                os.makedirs(video_dir, exist_ok=True)
-                new_video_path = os.path.join(video_dir, f"{command}.webm")
-                shutil.move(video_path, new_video_path)
-                print(f"[dsm] {command}: Video saved to {new_video_path}", flush=True)
-            except Exception as e:
-                print(
-                    f"[dsm] Warning: Failed to save video: {e}",
-                    file=sys.stderr,
-                    flush=True,
-                )
+            if os.getenv("DSM_RECORD_VIDEO"):
+                # Save and rename video before closing (even if error occurred)
+                try:
+                    # Get video path before closing page to avoid race condition
+                    video_path = await page.video.path()
+                    await page.close()
+
+                    # Rename video to include command name
+                    video_dir = os.path.dirname(video_path)
+                    os.makedirs(video_dir, exist_ok=True)
+                    new_video_path = os.path.join(video_dir, f"{command}.webm")
+                    shutil.move(video_path, new_video_path)
+                    print(
+                        f"[dsm] {command}: Video saved to {new_video_path}", flush=True
+                    )
+                except Exception as e:
+                    print(
+                        f"[dsm] Warning: Failed to save video: {e}",
+                        file=sys.stderr,
+                        flush=True,
+                    )
 
             await context.close()
             await browser.close()
@@ -550,7 +870,13 @@ def main():
     parser = argparse.ArgumentParser(description="DSM automation tool")
     parser.add_argument(
         "command",
-        choices=["wait-for-boot", "configure-admin", "post-wizard", "configure-system"],
+        choices=[
+            "wait-for-boot",
+            "configure-admin",
+            "post-wizard",
+            "configure-system",
+            "daemon",
+        ],
         help="Automation command to run",
     )
     parser.add_argument(